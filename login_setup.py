@@ -9,36 +9,48 @@ Supports:
 - SSO accounts (Apple/Google): paste a token copied from an authenticated browser session
 """
 
+from __future__ import annotations
+
 import asyncio
 import getpass
 import json
 import os
-import re
 import shutil
 import sys
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 # Add the src directory to the Python path for imports
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from monarchmoney import MonarchMoney, RequireMFAException
-from dotenv import load_dotenv
-from monarch_mcp_server.secure_session import secure_session
+if TYPE_CHECKING:
+    from monarchmoney import MonarchMoney
 
 AuthMethod = Literal["password", "token"]
 
+_JSON_TOKEN_KEYS = ("token", "access_token", "accessToken")
+
+_TOKEN_CHOICES = frozenset({"2", "token", "sso", "apple", "google"})
+
 
 def _choose_auth_method() -> AuthMethod:
     print("\nLogin methods:")
     print("  1) Email + password (Monarch account password)")
     print("  2) Apple/Google SSO (paste Monarch token from your browser session)")
     choice = input("Choose (1/2) [1]: ").strip().lower()
-    says_token = choice in {"2", "token", "sso", "apple", "google"}
+    says_token = choice in _TOKEN_CHOICES
     return "token" if says_token else "password"
 
 
+def _print_version() -> None:
+    try:
+        import monarchmoney
+        print(f"📦 MonarchMoney version: {getattr(monarchmoney, '__version__', 'unknown')}")
+    except Exception as e:
+        print(f"⚠️  Could not check version: {e}")
+
+
 def _print_sso_token_instructions() -> None:
     print("\n🍎 Apple/Google SSO token import")
     print("=" * 45)
@@ -56,6 +68,55 @@ def _print_sso_token_instructions() -> None:
     print("   Authorization: Bearer <token>")
 
 
+def _lower_aligned(s: str) -> str:
+    """
+    Lowercases `s` without changing its length, so indices into the result are
+    valid in `s`.
+    """
+    low = s.lower()
+    if len(low) != len(s):
+        # "İ" is the only character whose lowercase form is longer ("i̇"); swap it
+        # for "\0", which can't be part of any keyword we look for.
+        low = s.replace("\u0130", "\0").lower()
+    return low
+
+
+def _value_after_keyword(s: str, low: str, keyword: str) -> str | None:
+    """
+    Finds `keyword` (lowercase) as a whole word followed by whitespace and returns
+    the whitespace-delimited value after it, or None. `low` must be
+    `_lower_aligned(s)`.
+    """
+    i = low.find(keyword)
+    while i != -1:
+        j = i + len(keyword)
+        prev = s[i - 1] if i else ""
+        if not (prev.isalnum() or prev == "_") and s[j : j + 1].isspace():
+            rest = s[j:].split(None, 1)
+            return rest[0] if rest else None
+        i = low.find(keyword, i + 1)
+    return None
+
+
+def _token_from_json(s: str) -> str | None:
+    """
+    Pulls a token out of a pasted JSON object, preferring keys in the order of
+    _JSON_TOKEN_KEYS. Returns None if the paste isn't a JSON object.
+    """
+    try:
+        obj = json.loads(s)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+
+    for key in _JSON_TOKEN_KEYS:
+        val = obj.get(key)
+        if isinstance(val, str) and val.strip():
+            return val.strip()
+    return None
+
+
 def _normalize_token(raw: str) -> str:
     """
     Accepts a raw token or common wrapper formats (Bearer/Token header, JSON blob).
@@ -65,34 +126,30 @@ def _normalize_token(raw: str) -> str:
     if not s:
         return ""
 
+    # Fast path: a bare token has no whitespace and isn't a JSON blob, so none of
+    # the wrapper formats below can apply.
+    if s[0] != "{" and len(s.split(None, 1)) == 1:
+        return s.strip("\"'")
+
     # If user pasted JSON, try common keys first.
     if s.startswith("{") and s.endswith("}"):
-        try:
-            obj = json.loads(s)
-            for key in ("token", "access_token", "accessToken"):
-                val = obj.get(key)
-                if isinstance(val, str) and val.strip():
-                    s = val.strip()
-                    break
-        except Exception:
-            pass
+        s = _token_from_json(s) or s
 
     # If user pasted a header line or something containing Bearer/Token, extract it.
     # Match "Bearer <token>" or "Token <token>" anywhere in the string.
-    bearer = re.search(r"(?i)\bbearer\s+([^\s]+)", s)
+    low = _lower_aligned(s)
+    bearer = _value_after_keyword(s, low, "bearer")
     if bearer:
-        return bearer.group(1).strip().strip("\"'")
+        return bearer.strip("\"'")
 
-    token = re.search(r"(?i)\btoken\s+([^\s]+)", s)
-    if token and "authorization" in s.lower():
-        return token.group(1).strip().strip("\"'")
+    token = _value_after_keyword(s, low, "token")
+    if token and "authorization" in low:
+        return token.strip("\"'")
 
-    # Otherwise, allow a plain token or a simple prefix.
-    lowered = s.lower()
-    for prefix in ("bearer ", "token "):
-        if lowered.startswith(prefix):
-            s = s[len(prefix) :].strip()
-            break
+    # Otherwise, allow a plain token or a "Token " prefix without an Authorization
+    # label ("Bearer " prefixes were already handled above).
+    if low[:6] == "token ":
+        s = s[6:].strip()
 
     return s.strip().strip("\"'")
 
@@ -106,19 +163,17 @@ async def _test_connection(mm: MonarchMoney) -> int:
 
 
 async def main():
-    load_dotenv()
-    
     print("\n🏦 Monarch Money - MCP Setup (Cursor / Claude / etc.)")
     print("=" * 45)
     print("This will authenticate you once and store a token securely")
     print("for seamless access through your MCP client.\n")
-    
-    # Check the version first
-    try:
-        import monarchmoney
-        print(f"📦 MonarchMoney version: {getattr(monarchmoney, '__version__', 'unknown')}")
-    except Exception as e:
-        print(f"⚠️  Could not check version: {e}")
+
+    # Heavy third-party imports are deferred until the banner is on screen.
+    from monarchmoney import MonarchMoney, RequireMFAException
+    from dotenv import load_dotenv
+    from monarch_mcp_server.secure_session import secure_session
+
+    load_dotenv()
     
     try:
         # Clear any existing sessions (both old pickle files and keyring)
@@ -229,4 +284,7 @@ async def main():
         print(f"Error type: {type(e)}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if "--version" in sys.argv[1:]:
+        _print_version()
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# login_setup.py lives at the repo root rather than in the package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,52 @@
+"""Tests for login_setup.py startup behavior."""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import login_setup
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_defers_third_party_modules():
+    # Block the heavy imports outright so the check holds whether or not they're
+    # installed; importing login_setup must not touch them.
+    code = (
+        "import sys\n"
+        "for name in ('monarchmoney', 'dotenv', 'monarch_mcp_server.secure_session'):\n"
+        "    sys.modules[name] = None\n"
+        "import login_setup\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_print_version_without_monarchmoney(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "monarchmoney", None)
+    login_setup._print_version()
+    assert "Could not check version" in capsys.readouterr().out
+
+
+def test_print_version(monkeypatch, capsys):
+    fake = types.ModuleType("monarchmoney")
+    fake.__version__ = "1.2.3"
+    monkeypatch.setitem(sys.modules, "monarchmoney", fake)
+    login_setup._print_version()
+    assert "MonarchMoney version: 1.2.3" in capsys.readouterr().out
+
+
+def test_version_flag_skips_login():
+    result = subprocess.run(
+        [sys.executable, "login_setup.py", "--version"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "version" in result.stdout
+    assert "MCP Setup" not in result.stdout
@@ -0,0 +1,140 @@
+"""Tests for the token-paste normalization in login_setup.py."""
+
+import pytest
+
+from login_setup import _normalize_token
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("", ""),
+        ("   ", ""),
+        ("abc.def-ghi", "abc.def-ghi"),
+        ("  abc123  ", "abc123"),
+        ('"abc123"', "abc123"),
+        ("'abc123'", "abc123"),
+        ("abc123'", "abc123"),
+        ("{abc123", "{abc123"),
+    ],
+)
+def test_plain_token(raw, expected):
+    assert _normalize_token(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Bearer abc",
+        "bearer   abc  ",
+        "BEARER\tabc",
+        "Bearer\nabc",
+        "Bearer 'abc'",
+        "Authorization: Bearer abc",
+        "authorization:bearer abc",
+        "Authorization: Bearer abc extra",
+        "mybearer x bearer abc",
+    ],
+)
+def test_bearer_header(raw):
+    assert _normalize_token(raw) == "abc"
+
+
+@pytest.mark.parametrize("raw", ["mybearer abc", "bearer_x abc", "Bearer: abc"])
+def test_bearer_requires_whole_word(raw):
+    assert _normalize_token(raw) == raw
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Authorization: Token xyz",
+        "authorization: token 'xyz'",
+        "AUTHORIZATION TOKEN\txyz",
+    ],
+)
+def test_authorization_token_header(raw):
+    assert _normalize_token(raw) == "xyz"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("Token xyz", "xyz"),
+        ("TOKEN   'xyz'  ", "xyz"),
+        # Without an Authorization label, "token" only counts as a prefix.
+        ("x Token xyz", "x Token xyz"),
+        ("Token\txyz", "Token\txyz"),
+    ],
+)
+def test_token_prefix(raw, expected):
+    assert _normalize_token(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # "İ" lowercases to two characters; offsets must still line up.
+        ("İ Bearer abc", "abc"),
+        ("İİİ Authorization: Token xyz", "xyz"),
+        ("Bearer İabc", "İabc"),
+        ("İbearer abc", "İbearer abc"),
+        ("İ İbearer x Bearer abc", "abc"),
+    ],
+)
+def test_header_after_wide_lowercase_char(raw, expected):
+    assert _normalize_token(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('{"token": "abc"}', "abc"),
+        ('{"access_token": " abc "}', "abc"),
+        ('{"accessToken": "abc"}', "abc"),
+        ('{"accessToken": "c", "access_token": "b", "token": "a"}', "a"),
+        ('{"access_token": "b", "accessToken": "c"}', "b"),
+        ('{"token": "", "accessToken": "z"}', "z"),
+        ('{"token": "   ", "access_token": "z"}', "z"),
+        ('{"token": 5, "access_token": "z"}', "z"),
+        ('{"token": "Bearer q"}', "q"),
+        ('{"token": "a\\"b"}', 'a"b'),
+        ('{"token": "\\u0041b"}', "Ab"),
+    ],
+)
+def test_json_blob(raw, expected):
+    assert _normalize_token(raw) == expected
+
+
+def test_json_top_level_key_beats_nested():
+    raw = '{"data": {"token": "nested"}, "access_token": "top"}'
+    assert _normalize_token(raw) == "top"
+
+
+def test_json_duplicate_keys_last_wins():
+    assert _normalize_token('{"token": "a", "token": "b"}') == "b"
+
+
+def test_json_without_token_keys_is_returned_as_is():
+    assert _normalize_token('{"other": "v"}') == '{"other": "v"}'
+
+
+@pytest.mark.parametrize("raw", ['{"token": "abc",}', '{"token": abc}', "{ bad }"])
+def test_malformed_json_is_returned_as_is(raw):
+    assert _normalize_token(raw) == raw
+
+
+_PADDING = '"pad": "' + "x" * 200_000 + '", '
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("{" + _PADDING + '"access_token": "b", "token": "a\\"c"}', 'a"c'),
+        ("{" + _PADDING + '"token": "  ", "accessToken": "z"}', "z"),
+        ("{" + _PADDING + '"data": {"token": "nested"}, "access_token": "top"}', "top"),
+        ("{" + _PADDING + '"s": "}{", "token": "a", "token": "b"}', "b"),
+    ],
+)
+def test_large_json_blob(raw, expected):
+    assert _normalize_token(raw) == expected